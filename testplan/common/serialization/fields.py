@@ -2,6 +2,7 @@
 Custom marshmallow fields.
 """
 import abc
+import datetime
 import pprint
 import warnings
 
@@ -14,7 +15,7 @@ import pytz
 
 from marshmallow import fields
 from marshmallow.compat import text_type, binary_type
-from marshmallow.utils import missing as missing_
+from marshmallow.utils import missing as missing_, is_collection
 from marshmallow.base import SchemaABC
 from marshmallow import class_registry
 from marshmallow.fields import _RECURSIVE_NESTED
@@ -32,6 +33,7 @@ from testplan.common.utils import comparison
 # pickle. All other types will be converted to strings before pickling.
 # types.NoneType is gone in python3 so we inspect the type of None directly.
 COMPATIBLE_TYPES = (bool, float, type(None), str, bytes, int)
+_COMPATIBLE_TYPES_SET = frozenset(COMPATIBLE_TYPES)
 
 
 class Serializable(metaclass=abc.ABCMeta):
@@ -167,6 +169,12 @@ class Unicode(fields.Field):
             return text_type(value)
 
 
+def _native_or_pretty(value):
+    if isinstance(value, Serializable):
+        return value.serialize()
+    return native_or_pformat(value)
+
+
 class NativeOrPretty(fields.Field):
     """
     Uses serialization compatible native values
@@ -174,10 +182,7 @@ class NativeOrPretty(fields.Field):
     """
 
     def _serialize(self, value, attr, obj):
-        if isinstance(value, Serializable):
-            return value.serialize()
-        else:
-            return native_or_pformat(value)
+        return _native_or_pretty(value)
 
 
 class NativeOrPrettyDict(fields.Field):
@@ -206,6 +211,33 @@ class NativeOrPrettyDict(fields.Field):
         return native_or_pformat_dict(value)
 
 
+class NativeOrPrettyTable(fields.Field):
+    """
+    Table (list of rows) serialization with native or pretty formatted cell
+    values, same output as nesting ``NativeOrPretty`` in two ``List`` fields.
+    Cells of basic builtin types are kept without further dispatch.
+    """
+
+    def _serialize(self, value, attr, obj):
+        if value is None:
+            return None
+        if not is_collection(value):
+            value = [value]
+
+        basic = _COMPATIBLE_TYPES_SET
+        rows = []
+        for row in value:
+            if not is_collection(row):
+                row = [row]
+            rows.append(
+                [
+                    cell if type(cell) in basic else _native_or_pretty(cell)
+                    for cell in row
+                ]
+            )
+        return rows
+
+
 # TODO: Move to entries
 class RowComparisonField(fields.Field):
     """Serialization logic for RowComparison"""
@@ -293,6 +325,8 @@ class GenericNested(fields.Field):
         self.schema_context = schema_context
         self.type_field = type_field
         self.many = kwargs.get("many", False)
+        self._schemas_by_name = None
+        self._schemas_by_type = {}
         super(GenericNested, self).__init__(default=default, **kwargs)
 
     def _get_schema_obj(self, schema_value):
@@ -341,25 +375,41 @@ class GenericNested(fields.Field):
             result[key] = self._get_schema_obj(schema_value)
         return result
 
-    def _serialize(self, nested_obj, attr, obj):
-
-        if nested_obj is None:
-            return None
-
-        schemas = self.schemas
+    def _get_schema_obj_for(self, nested_obj):
+        """
+        Return the schema object for ``nested_obj``. Schema objects are built
+        once per field, then looked up by the exact type of the object.
+        """
+        obj_type = type(nested_obj)
+        try:
+            return self._schemas_by_type[obj_type]
+        except KeyError:
+            pass
 
-        if isinstance(nested_obj, (list, tuple)):
-            return [self._serialize(nobj, attr, obj) for nobj in nested_obj]
+        if self._schemas_by_name is None:
+            self._schemas_by_name = self.schemas
 
-        class_name = nested_obj.__class__.__name__
+        class_name = obj_type.__name__
 
-        if class_name not in schemas:
+        if class_name not in self._schemas_by_name:
             raise KeyError(
                 "No schema declaration found in"
                 " `schema_context` for : {}".format(class_name)
             )
 
-        schema_obj = schemas[class_name]
+        schema_obj = self._schemas_by_name[class_name]
+        self._schemas_by_type[obj_type] = schema_obj
+        return schema_obj
+
+    def _serialize(self, nested_obj, attr, obj):
+
+        if nested_obj is None:
+            return None
+
+        if isinstance(nested_obj, (list, tuple)):
+            return [self._serialize(nobj, attr, obj) for nobj in nested_obj]
+
+        schema_obj = self._get_schema_obj_for(nested_obj)
 
         ret, errors = schema_obj.dump(
             nested_obj, many=False, update_fields=False
@@ -370,6 +420,28 @@ class GenericNested(fields.Field):
         return ret
 
 
+_UTC_TZINFOS = (pytz.UTC, datetime.timezone.utc)
+
+
+def utc_isoformat(value):
+    """
+    Return the ISO 8601 representation of a ``datetime`` in UTC, naive values
+    are assumed to be in UTC already. Same output as marshmallow's default
+    ``DateTime`` formatting.
+    """
+    tzinfo = value.tzinfo
+    if tzinfo is None:
+        value = value.replace(tzinfo=pytz.UTC)
+    elif tzinfo not in _UTC_TZINFOS:
+        value = value.astimezone(pytz.UTC)
+    return value.isoformat()
+
+
+def parse_utc_datetime(value):
+    """Parse a timestamp string into a UTC ``datetime``."""
+    return parser.parse(value).replace(tzinfo=pytz.UTC)
+
+
 class UTCDateTime(fields.DateTime):
     """
     While parsing timestamps, original `fields.Datetime` tries
@@ -385,10 +457,25 @@ class UTCDateTime(fields.DateTime):
     So we specify the deserialization logic explicitly to
     make use of dateutil. In addition we use ``pytz``
     timezones instead of ``dateutil.tz``.
+
+    ISO formatted serialization calls ``datetime.isoformat`` directly,
+    producing the same output as marshmallow's formatter without the
+    timezone conversion for values that are already in UTC.
     """
 
+    def _serialize(self, value, attr, obj):
+        if self.localtime or self.dateformat not in (None, "iso", "iso8601"):
+            return super(UTCDateTime, self)._serialize(value, attr, obj)
+
+        if value is None:
+            return None
+        try:
+            return utc_isoformat(value)
+        except (AttributeError, TypeError, ValueError):
+            self.fail("format", input=value)
+
     def _deserialize(self, value, attr, data):
-        return parser.parse(value).replace(tzinfo=pytz.UTC)
+        return parse_utc_datetime(value)
 
 
 class ExceptionField(fields.Field):
@@ -1,3 +1,5 @@
+import threading
+
 from marshmallow import Schema
 
 from testplan.common.utils.registry import Registry
@@ -65,5 +67,33 @@ class SchemaRegistry(Registry):
     `serialize` method that calls `dump` on the underlying schema mapping.
     """
 
+    def __init__(self):
+        super(SchemaRegistry, self).__init__()
+        self._local = threading.local()
+
+    def _free_schemas(self, schema_class):
+        """
+        Schema objects that are not in use by the current thread. They keep
+        error state while dumping so they are neither shared between threads
+        nor between nested calls, e.g. for groups of entries.
+        """
+        try:
+            free_schemas = self._local.free_schemas
+        except AttributeError:
+            free_schemas = self._local.free_schemas = {}
+        try:
+            return free_schemas[schema_class]
+        except KeyError:
+            return free_schemas.setdefault(schema_class, [])
+
     def serialize(self, obj):
-        return self[obj](strict=True).dump(obj).data
+        schema_class = self[obj]
+        free_schemas = self._free_schemas(schema_class)
+        try:
+            schema = free_schemas.pop()
+        except IndexError:
+            schema = schema_class(strict=True)
+        try:
+            return schema.dump(obj).data
+        finally:
+            free_schemas.append(schema)
@@ -1,6 +1,9 @@
 """System process utilities module."""
 
+import os
 import time
+import logging
+import select
 import psutil
 import warnings
 
@@ -9,7 +12,7 @@ import platform
 import threading
 import functools
 
-from .timing import get_sleeper, exponential_interval
+from .timing import exponential_interval
 from testplan.common.utils.logger import TESTPLAN_LOGGER
 
 
@@ -23,6 +26,36 @@ def _log_proc(msg, warn=False, output=None):
         warnings.warn(msg)
 
 
+def _wait_process(proc, timeout):
+    """
+    Wait for up to ``timeout`` seconds for ``proc`` to exit. On Linux, the
+    process file descriptor is polled so that we wake up as soon as it exits,
+    without sleeping in between ``poll()`` calls.
+
+    :return: Exit code of process, ``None`` if still running
+    """
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is not None:
+        try:
+            pidfd = pidfd_open(proc.pid)
+        except OSError:
+            # Kernel without pidfd support, or process already reaped.
+            pass
+        else:
+            try:
+                poller = select.poll()
+                poller.register(pidfd, select.POLLIN)
+                poller.poll(timeout * 1000)
+            finally:
+                os.close(pidfd)
+            return proc.poll()
+
+    try:
+        return proc.wait(timeout)
+    except subprocess.TimeoutExpired:
+        return None
+
+
 def kill_process(proc, timeout=5, signal_=None, output=None):
     """
     If alive, kills the process.
@@ -52,12 +85,7 @@ def kill_process(proc, timeout=5, signal_=None, output=None):
     else:
         proc.terminate()
 
-    sleeper = get_sleeper((0.05, 1), timeout=timeout)
-    while next(sleeper):
-        if retcode is None:
-            retcode = proc.poll()
-        else:
-            break
+    retcode = _wait_process(proc, timeout)
 
     if retcode is None:
         try:
@@ -216,8 +244,13 @@ def execute_cmd(
     else:
         cmd_string = cmd
 
-    if not label:
-        label = hash(cmd_string) % 1000
+    # Labels and timings are only ever logged at debug level.
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        if not label:
+            label = hash(cmd_string) % 1000
+        logger.debug("Executing command [%s]: '%s'", label, cmd_string)
+        start_time = time.monotonic()
 
     if stdout is None:
         stdout = subprocess.PIPE
@@ -225,23 +258,30 @@ def execute_cmd(
     if stderr is None:
         stderr = subprocess.PIPE
 
-    logger.debug("Executing command [%s]: '%s'", label, cmd_string)
-    start_time = time.time()
-
-    handler = subprocess.Popen(cmd, stdout=stdout, stderr=stderr, env=env)
+    # Commands are never interactive: stdin is not inherited so that ssh and
+    # copy commands cannot block reading from it.
+    handler = subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=stdout,
+        stderr=stderr,
+        env=env,
+    )
     stdout, stderr = handler.communicate()
-    elapsed = time.time() - start_time
 
     if handler.returncode != 0:
-        logger.debug(
-            "Failed executing command [%s] after %.2f sec.", label, elapsed
-        )
+        if debug:
+            logger.debug(
+                "Failed executing command [%s] after %.2f sec.",
+                label,
+                time.monotonic() - start_time,
+            )
 
-        if stdout:
-            logger.debug("Stdout:\n%s", stdout)
+            if stdout:
+                logger.debug("Stdout:\n%s", stdout)
 
-        if stderr:
-            logger.debug("Stderr:\n%s", stderr)
+            if stderr:
+                logger.debug("Stderr:\n%s", stderr)
 
         if check:
             raise RuntimeError(
@@ -249,8 +289,12 @@ def execute_cmd(
                     cmd_string, handler.returncode
                 )
             )
-    else:
-        logger.debug("Command [%s] finished in %.2f sec", label, elapsed)
+    elif debug:
+        logger.debug(
+            "Command [%s] finished in %.2f sec",
+            label,
+            time.monotonic() - start_time,
+        )
 
     return handler.returncode
 
@@ -2,17 +2,39 @@
 
 import os
 import sys
+import shlex
 import getpass
+import functools
 import subprocess
 
+# The control socket path must fit in sun_path (104 bytes on macOS)
+# including the temporary suffix ssh appends while binding, so use a short
+# directory and the fixed length %C hash of user, host and port.
+SSH_CONTROL_PATH_FORMAT = "/tmp/tp-{pid}-{key}-%C"
 
-def ssh_cmd(ssh_cfg, command):
-    """Returns ssh command."""
+
+def ssh_control_path(key):
+    """
+    Returns the control socket path of a master ssh connection. The path is
+    unique per process and ``key``, so that closing a master does not affect
+    the sessions of other owners connected to the same host.
+    """
+    return SSH_CONTROL_PATH_FORMAT.format(pid=os.getpid(), key=key)
+
+
+@functools.lru_cache(maxsize=None)
+def current_user():
+    """Returns the login name used on remote hosts, looked up once."""
+    return getpass.getuser()
+
+
+def _ssh_binary():
+    """Returns ssh binary path."""
     try:
-        binary = os.environ["SSH_BINARY"]
+        return os.environ["SSH_BINARY"]
     except KeyError:
         if os.name != "nt":
-            binary = (
+            return (
                 subprocess.check_output("which ssh", shell=True)
                 .decode(sys.stdout.encoding)
                 .strip()
@@ -20,35 +42,141 @@ def ssh_cmd(ssh_cfg, command):
         else:
             raise Exception("SSH binary not provided.")
 
-    cmd = [binary]
-    cmd.extend(["-o", "ConnectTimeout=10"])
+
+def ssh_control_options(control_path=None):
+    """
+    Returns ssh options to reuse the master connection at ``control_path``,
+    ssh connects directly while no master is running.
+    """
+    if control_path is None or os.name == "nt":
+        return []
+    return ["-o", "ControlPath={}".format(control_path)]
+
+
+# Remote commands are never interactive, fail instead of prompting.
+SSH_BATCH_OPTIONS = ["-o", "BatchMode=yes"]
+
+
+def _ssh_control_cmd(ssh_cfg, options):
+    cmd = [_ssh_binary()]
+    cmd.extend(options)
+    cmd.extend(ssh_control_options(ssh_cfg.get("control_path")))
 
     if ssh_cfg.get("port"):
         cmd.extend(["-p", ssh_cfg["port"]])
 
-    cmd.append("{}@{}".format(getpass.getuser(), ssh_cfg["host"]))
-    cmd.append(command)
+    cmd.append("{}@{}".format(current_user(), ssh_cfg["host"]))
+    return cmd
 
+
+def ssh_cmd(ssh_cfg, command):
+    """Returns ssh command."""
+    cmd = _ssh_control_cmd(
+        ssh_cfg, ["-o", "ConnectTimeout=10"] + SSH_BATCH_OPTIONS
+    )
+    cmd.append(command)
     return cmd
 
 
-def copy_cmd(source, target, exclude=None, port=None, deref_links=False):
-    """Returns remote copy command."""
-    if os.environ.get("RSYNC_BINARY"):
-        cmd = [os.environ["RSYNC_BINARY"], "-r"]
-        cmd.append("-L" if deref_links else "-l")
+def ssh_master_cmd(ssh_cfg):
+    """
+    Returns command that starts a background master connection to a remote
+    host, kept alive for 10 minutes after its last use.
+    """
+    return _ssh_control_cmd(
+        ssh_cfg,
+        [
+            "-MNf",
+            "-o",
+            "ConnectTimeout=10",
+            "-o",
+            "ControlPersist=600",
+        ]
+        + SSH_BATCH_OPTIONS,
+    )
+
+
+def ssh_check_cmd(ssh_cfg):
+    """Returns command that checks the master connection is running."""
+    return _ssh_control_cmd(ssh_cfg, ["-O", "check"])
+
+
+def ssh_exit_cmd(ssh_cfg):
+    """Returns command that closes the master connection to a remote host."""
+    return _ssh_control_cmd(ssh_cfg, ["-O", "exit"])
+
+
+def shell_quote(arg):
+    """
+    Escapes an argument of a command run by the remote shell. A leading
+    ``~`` is left unquoted so that home relative paths are still expanded,
+    any other shell syntax such as ``$VAR`` is passed literally.
+    """
+    arg = str(arg)
+    if arg == "~":
+        return arg
+    if arg.startswith("~/"):
+        return "~/" + shlex.quote(arg[2:])
+    return shlex.quote(arg)
+
+
+def _sources(source):
+    """Copy builders accept either a single source path or a list of them."""
+    return source if isinstance(source, list) else [source]
+
+
+def rsync_cmd(
+    source,
+    target,
+    exclude=None,
+    port=None,
+    deref_links=False,
+    control_path=None,
+):
+    """
+    Returns rsync command. Modification times are preserved so that repeated
+    copies of the same tree only transfer the files that changed, data is
+    compressed on the wire and interrupted transfers are kept for resuming.
+    """
+    cmd = [os.environ.get("RSYNC_BINARY", "rsync"), "-rtz"]
+    cmd.append("-L" if deref_links else "-l")
+    cmd.append("--partial")
+
+    if exclude is not None:
+        cmd.extend("--exclude={}".format(item) for item in exclude)
+
+    ssh = [os.environ.get("SSH_BINARY", "ssh")]
+    ssh.extend(ssh_control_options(control_path))
+    if port is not None:
+        ssh.extend(["-p", str(port)])
+    cmd.extend(["-e", " ".join(ssh)])
 
-        if exclude is not None:
-            for item in exclude:
-                cmd.extend(["--exclude", item])
+    cmd.extend(_sources(source))
+    cmd.append(target)
+    return cmd
 
-        if port is not None:
-            # Add '-e "ssh -p "' option to rsync command
-            ssh = "{} -p {}".format(os.environ["SSH_BINARY"], port)
-            cmd.extend(["-e", ssh])
 
-        cmd.extend([source, target])
-        return cmd
+def copy_cmd(
+    source,
+    target,
+    exclude=None,
+    port=None,
+    deref_links=False,
+    control_path=None,
+):
+    """
+    Returns remote copy command, rsync is used when ``RSYNC_BINARY`` is set
+    and scp otherwise. Multiple sources are copied into the target directory.
+    """
+    if os.environ.get("RSYNC_BINARY"):
+        return rsync_cmd(
+            source,
+            target,
+            exclude=exclude,
+            port=port,
+            deref_links=deref_links,
+            control_path=control_path,
+        )
 
     # Proceed with SCP.
     try:
@@ -61,9 +189,11 @@ def copy_cmd(source, target, exclude=None, port=None, deref_links=False):
         else:
             raise Exception("SCP binary not provided.")
     cmd = [binary, "-r"]
+    cmd.extend(ssh_control_options(control_path))
     if port is not None:
         cmd.extend(["-P", port])
-    cmd.extend([source, target])
+    cmd.extend(_sources(source))
+    cmd.append(target)
     return cmd
 
 
@@ -74,4 +204,4 @@ def link_cmd(path, link):
 
 def remote_filepath_exists(ssh_cmd, ssh_cfg, path):
     """Checks if filepath exists."""
-    return ssh_cmd(ssh_cfg, "test -e {}".format(path))
+    return ssh_cmd(ssh_cfg, "test -e {}".format(shell_quote(path)))
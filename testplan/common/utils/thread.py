@@ -1,14 +1,18 @@
 """Threading utilities."""
 
 import time
+import types
 import threading
 
 from .timing import TimeoutException
 
+# Shared read-only default, ``Thread`` only unpacks its kwargs.
+_EMPTY_KWARGS = types.MappingProxyType({})
+
 
 def execute_as_thread(
     target,
-    args=None,
+    args=(),
     kwargs=None,
     daemon=False,
     join=True,
@@ -36,23 +40,38 @@ def execute_as_thread(
     :param timeout: Timeout duration.
     :type timeout: :py:class:`~testplan.common.utils.timing.TimeoutException`
     """
+    done = threading.Event()
+
+    def _run(*_args, **_kwargs):
+        try:
+            target(*_args, **_kwargs)
+        finally:
+            done.set()
+
     thr = threading.Thread(
-        target=target, args=args or tuple(), kwargs=kwargs or {}
+        target=_run,
+        args=args or (),
+        kwargs=kwargs or _EMPTY_KWARGS,
+        daemon=daemon,
     )
-    thr.daemon = daemon
     thr.start()
     if join is True:
-        start_time = time.time()
-        while True:
-            if not thr.is_alive():
-                return
-            if break_join is not None and break_join():
+        if break_join is None:
+            # Nothing to poll for, block until the target completes.
+            if not done.wait(timeout or None):
+                raise TimeoutException(
+                    "Thread {} timeout after {}s".format(thr, timeout)
+                )
+            return
+
+        end_time = time.monotonic() + timeout if timeout else None
+        while not done.wait(join_sleep):
+            if break_join():
                 break
-            if timeout and time.time() - start_time > timeout:
+            if end_time is not None and time.monotonic() > end_time:
                 raise TimeoutException(
                     "Thread {} timeout after {}s".format(thr, timeout)
                 )
-            time.sleep(join_sleep)
 
 
 def interruptible_join(thread, timeout=None):
@@ -68,13 +87,20 @@ def interruptible_join(thread, timeout=None):
     if timeout is None:
         end_time = None
     else:
-        end_time = time.time() + timeout
-
-    while end_time is None or time.time() < end_time:
-        time.sleep(0.1)
+        end_time = time.monotonic() + timeout
+
+    # Join in short slices rather than in one go, so that signals are still
+    # handled in the main thread while waiting.
+    while True:
+        if end_time is None:
+            join_slice = 0.1
+        else:
+            join_slice = min(0.1, end_time - time.monotonic())
+            if join_slice <= 0:
+                break
+        thread.join(join_slice)
         if not thread.is_alive():
-            thread.join()
-            break
+            return
 
     if thread.is_alive():
         raise TimeoutException(
@@ -9,11 +9,15 @@ import copy
 import pathlib
 import hashlib
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from testplan import defaults
 
 from testplan.common.config import ConfigOption
 from testplan.common.exporters import ExporterConfig
-from testplan.common.utils.path import makedirs
 
 from testplan.report import ReportCategories
 from testplan.report.testing.schemas import TestReportSchema
@@ -36,6 +40,28 @@ def gen_attached_report_names(json_path):
     )
 
 
+def dump_json(data, path):
+    """
+    Write ``data`` to ``path`` as JSON. The document is encoded in one go by
+    the C encoder instead of chunk by chunk as ``json.dump`` does. If the
+    ``TESTPLAN_FAST_JSON`` environment variable is set and ``orjson`` is
+    installed, it is used for encoding instead.
+    """
+    if orjson is not None and os.environ.get("TESTPLAN_FAST_JSON"):
+        try:
+            content = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. integers out of 64 bit range, use the json module
+        else:
+            with open(path, "wb") as json_file:
+                json_file.write(content)
+            return
+
+    content = json.dumps(data)
+    with open(path, "w") as json_file:
+        json_file.write(content)
+
+
 class JSONExporterConfig(ExporterConfig):
     """
     Configuration object for
@@ -95,10 +121,8 @@ class JSONExporter(Exporter):
                 meta, structure, assertions = self.split_json_report(data)
                 attachments_dir.mkdir(parents=True, exist_ok=True)
 
-                with open(structure_filepath, "w") as json_file:
-                    json.dump(structure, json_file)
-                with open(assertions_filepath, "w") as json_file:
-                    json.dump(assertions, json_file)
+                dump_json(structure, structure_filepath)
+                dump_json(assertions, assertions_filepath)
 
                 save_attachments(report=source, directory=attachments_dir)
                 meta["version"] = 2
@@ -113,14 +137,12 @@ class JSONExporter(Exporter):
                 meta["structure_file"] = structure_filename
                 meta["assertions_file"] = assertions_filename
 
-                with open(json_path, "w") as json_file:
-                    json.dump(meta, json_file)
+                dump_json(meta, json_path)
             else:
                 save_attachments(report=source, directory=attachments_dir)
                 data["version"] = 1
 
-                with open(json_path, "w") as json_file:
-                    json.dump(data, json_file)
+                dump_json(data, json_path)
 
             self.logger.exporter_info("JSON generated at %s", json_path)
             return self.cfg.json_path
@@ -4,7 +4,6 @@ which can display the test result.
 """
 
 import os
-import json
 
 from testplan import defaults
 from testplan.common.utils.timing import wait
@@ -14,6 +13,7 @@ from testplan.common.exporters import ExporterConfig
 from testplan.report.testing.schemas import TestReportSchema
 from testplan.web_ui import web_app
 from ..base import Exporter, save_attachments
+from ..json import dump_json
 
 
 class WebServerExporterConfig(ExporterConfig):
@@ -78,8 +78,7 @@ class WebServerExporter(Exporter):
         data = test_plan_schema.dump(source).data
 
         # Save the Testplan report as a JSON.
-        with open(defaults.JSON_PATH, "w") as json_file:
-            json.dump(data, json_file)
+        dump_json(data, defaults.JSON_PATH)
 
         # Save any attachments.
         data_path = os.path.dirname(defaults.JSON_PATH)
@@ -1,11 +1,15 @@
 """Schema classes for test Reports."""
 
-import functools
 import json
+import sys
 
 from boltons.iterutils import remap, is_scalar
 
 from marshmallow import Schema, fields, post_load
+from marshmallow.decorators import PRE_DUMP, POST_DUMP
+from marshmallow.exceptions import ValidationError
+from marshmallow.schema import MarshalResult
+from marshmallow.utils import missing
 
 from testplan.common.serialization.schemas import load_tree_data
 from testplan.common.report.schemas import ReportSchema, ReportLogSchema
@@ -40,8 +44,11 @@ class TagField(fields.Field):
         }
 
     def _deserialize(self, value, attr, data):
+        # Tag names & values repeat across the whole report, interning them
+        # lets all the deserialized tag dicts share the same strings.
         return {
-            tag_name: set(tag_values) for tag_name, tag_values in value.items()
+            sys.intern(tag_name): set(map(sys.intern, tag_values))
+            for tag_name, tag_values in value.items()
         }
 
 
@@ -49,21 +56,46 @@ class TimerField(fields.Field):
     """
     Field for serializing ``timer.Timer`` objects, which is a ``dict``
     of ``timer.Interval``.
+
+    Intervals only have two timestamps, so they are converted inline rather
+    than by ``IntervalSchema``. The schema is only used as a fallback, to
+    report errors for invalid values. Schema instances keep error state so a
+    new one is built for each fallback rather than shared between threads.
     """
 
     def _serialize(self, value, attr, obj):
-        return {
-            k: IntervalSchema(strict=True).dump(v).data
-            for k, v in value.items()
-        }
+        isoformat = custom_fields.utc_isoformat
+        result = {}
+        try:
+            # ``Interval`` is a named tuple, unpack it rather than reading
+            # each attribute twice.
+            for k, (start, end) in value.items():
+                result[k] = {
+                    "start": None if start is None else isoformat(start),
+                    "end": None if end is None else isoformat(end),
+                }
+            return result
+        except (AttributeError, TypeError, ValueError):
+            schema = IntervalSchema(strict=True)
+            return {k: schema.dump(v).data for k, v in value.items()}
 
     def _deserialize(self, value, attr, data):
-        return timing.Timer(
-            {
-                k: IntervalSchema(strict=True).load(v).data
-                for k, v in value.items()
-            }
-        )
+        parse = custom_fields.parse_utc_datetime
+        try:
+            return timing.Timer(
+                {
+                    k: timing.Interval(
+                        parse(v["start"]),
+                        None if v["end"] is None else parse(v["end"]),
+                    )
+                    for k, v in value.items()
+                }
+            )
+        except (KeyError, AttributeError, TypeError, ValueError):
+            schema = IntervalSchema(strict=True)
+            return timing.Timer(
+                {k: schema.load(v).data for k, v in value.items()}
+            )
 
 
 class EntriesField(fields.Field):
@@ -71,8 +103,22 @@ class EntriesField(fields.Field):
     Handle encoding problems gracefully
     """
 
+    # Scalar types that can always be JSON encoded as they are.
+    _JSON_SAFE_TYPES = frozenset((str, int, float, bool, type(None)))
+
+    # Container types copied without ``remap``, subclasses such as
+    # ``OrderedDict`` or named tuples still go through ``remap``.
+    _PLAIN_CONTAINER_TYPES = frozenset((dict, list, tuple))
+
     @staticmethod
     def _json_serializable(v):
+        # Binary data is never JSON serializable, no need to try encoding it.
+        if isinstance(v, bytes):
+            return False
+        # The json module encodes subclasses of these by their base type
+        # (e.g. ``IntEnum`` or ``numpy.float64``), so they always succeed.
+        if isinstance(v, (str, int, float)):
+            return True
         try:
             json.dumps(v, ensure_ascii=True)
         except (UnicodeDecodeError, TypeError):
@@ -80,21 +126,106 @@ class EntriesField(fields.Field):
         else:
             return True
 
+    def _visit(self, parent, key, value):
+        """
+        ``remap`` visitor, return
+            True - keep the node unchange
+            False - remove the node
+            tuple - update the node data.
+        """
+        if type(value) in self._JSON_SAFE_TYPES:
+            return True
+        if is_scalar(value) and not self._json_serializable(value):
+            return key, str(value)
+        return True
+
+    def _convert_leaf(self, value):
+        """Return a JSON friendly version of a non container value."""
+        if type(value) in self._JSON_SAFE_TYPES:
+            return value
+        if is_scalar(value):
+            if self._json_serializable(value):
+                return value
+            return str(value)
+        # Other container types are left to ``remap``.
+        return remap(value, visit=self._visit)
+
     def _serialize(self, value, attr, obj):
         # we don't need a _deserialize() here as we don't (and can't)
         # convert str back to non-json-serializable.
-        def visit(parent, key, _value):
-            """
-            return
-                True - keep the node unchange
-                False - remove the node
-                tuple - update the node data.
-            """
-            if is_scalar(_value) and not self._json_serializable(_value):
-                return key, str(_value)
-            return True
+        if type(value) not in self._PLAIN_CONTAINER_TYPES:
+            return remap(value, visit=self._visit)
+
+        # Plain dict / list / tuple trees are copied with an explicit stack
+        # instead of going through the generic ``remap`` callbacks. Each
+        # frame is ``(items, new_node, parent_frame, key)``, ``memo`` maps
+        # ``id`` of source containers to their copies so shared (and
+        # self-referencing) containers are copied once.
+        memo = {}
+
+        def new_frame(node, parent, key):
+            if type(node) is dict:
+                frame = (iter(node.items()), {}, parent, key)
+            else:
+                frame = (iter(enumerate(node)), [], parent, key)
+            if type(node) is not tuple:
+                memo[id(node)] = frame[1]
+            return frame
+
+        def finish(node, frame):
+            new_node = frame[1]
+            if type(node) is tuple:
+                new_node = tuple(new_node)
+                memo[id(node)] = new_node
+            return new_node
+
+        root_frame = new_frame(value, None, None)
+        stack = [(value, root_frame)]
+        result = None
+
+        while stack:
+            node, frame = stack[-1]
+            items, new_node, _, _ = frame
+            for key, child in items:
+                if type(child) in self._PLAIN_CONTAINER_TYPES:
+                    copied = memo.get(id(child))
+                    if copied is None:
+                        stack.append((child, new_frame(child, frame, key)))
+                        break
+                else:
+                    copied = self._convert_leaf(child)
+
+                if type(new_node) is dict:
+                    new_node[key] = copied
+                else:
+                    new_node.append(copied)
+            else:
+                stack.pop()
+                copied = finish(node, frame)
+                parent, key = frame[2], frame[3]
+                if parent is None:
+                    result = copied
+                elif type(parent[1]) is dict:
+                    parent[1][key] = copied
+                else:
+                    parent[1].append(copied)
+
+        return result
+
+
+class EntriesList(fields.List):
+    """
+    List of ``EntriesField``, serializes a plain list of entries in a single
+    pass over the whole list instead of one pass per entry.
+    """
+
+    def __init__(self, **kwargs):
+        super(EntriesList, self).__init__(EntriesField(), **kwargs)
 
-        return remap(value, visit=visit)
+    def _serialize(self, value, attr, obj):
+        if type(value) is list:
+            return self.container._serialize(value, attr, obj)
+        return super(EntriesList, self)._serialize(value, attr, obj)
 
 
 class TestCaseReportSchema(ReportSchema):
@@ -104,7 +235,7 @@ class TestCaseReportSchema(ReportSchema):
 
     status_override = fields.String(allow_none=True)
 
-    entries = fields.List(EntriesField())
+    entries = EntriesList()
 
     category = fields.String(dump_only=True)
     status = fields.String()
@@ -116,6 +247,97 @@ class TestCaseReportSchema(ReportSchema):
 
     status_reason = fields.String(allow_none=True)
 
+    # Per-instance list of ``(key, attribute, field, passthrough_type)``,
+    # built on first dump and reset whenever the bound fields change.
+    _dump_plan = None
+
+    def _update_fields(self, obj=None, many=False):
+        self._dump_plan = None
+        return super(TestCaseReportSchema, self)._update_fields(
+            obj=obj, many=many
+        )
+
+    def _get_dump_plan(self):
+        if self._dump_plan is None:
+            plan = []
+            for name, field_obj in self.fields.items():
+                if field_obj.load_only:
+                    continue
+                if isinstance(field_obj, fields.String):
+                    passthrough_type = str
+                elif isinstance(field_obj, fields.Boolean):
+                    passthrough_type = bool
+                else:
+                    passthrough_type = None
+                plan.append(
+                    (
+                        field_obj.dump_to or name,
+                        field_obj.attribute or name,
+                        field_obj,
+                        passthrough_type,
+                    )
+                )
+            self._dump_plan = plan
+        return self._dump_plan
+
+    def _has_dump_processors(self):
+        return any(
+            self.__processors__[(tag, pass_many)]
+            for tag in (PRE_DUMP, POST_DUMP)
+            for pass_many in (False, True)
+        )
+
+    def _fast_dump(self, obj):
+        """
+        Serialize a single report with plain attribute access and direct
+        ``_serialize`` calls, skipping marshmallow's generic marshaller.
+        """
+        data = {}
+        for key, attr, field_obj, passthrough_type in self._get_dump_plan():
+            if field_obj._CHECK_ATTRIBUTE:
+                value = getattr(obj, attr, missing)
+                if value is missing:
+                    default = field_obj.default
+                    if callable(default):
+                        data[key] = default()
+                    elif default is not missing:
+                        data[key] = default
+                    continue
+                if type(value) is passthrough_type:
+                    data[key] = value
+                    continue
+            else:
+                value = None
+
+            if isinstance(field_obj, fields.Number):
+                data[key] = field_obj.serialize(
+                    attr, obj, accessor=self.get_attribute
+                )
+            else:
+                data[key] = field_obj._serialize(value, attr, obj)
+        return data
+
+    def dump(self, obj, many=None, update_fields=True, **kwargs):
+        many = self.many if many is None else bool(many)
+        if many or kwargs or self.prefix or self._has_dump_processors():
+            return super(TestCaseReportSchema, self).dump(
+                obj, many=many, update_fields=update_fields, **kwargs
+            )
+
+        try:
+            data = self._fast_dump(obj)
+        except ValidationError:
+            # Let marshmallow collect the errors and handle them.
+            return super(TestCaseReportSchema, self).dump(
+                obj, many=False, update_fields=update_fields
+            )
+        return MarshalResult(data, {})
+
+    def get_attribute(self, obj, attr, default):
+        # Report objects implement ``__getitem__`` for child lookup, so skip
+        # the key lookup attempted by marshmallow's default accessor.
+        return getattr(obj, attr, default)
+
     @post_load
     def make_report(self, data):
         """
@@ -129,8 +351,7 @@ class TestCaseReportSchema(ReportSchema):
 
         # We can discard the type field since we know what kind of report we
         # are making.
-        if "type" in data:
-            data.pop("type")
+        data.pop("type", None)
 
         rep = super(TestCaseReportSchema, self).make_report(data)
         rep.status_override = status_override
@@ -169,6 +390,11 @@ class TestGroupReportSchema(TestCaseReportSchema):
         return rep
 
 
+def _load_test_tree(data):
+    """Deserialize a test group sub tree."""
+    return load_tree_data(data, TestGroupReportSchema, TestCaseReportSchema)
+
+
 class TestReportSchema(Schema):
     """Schema for test report root, ``testing.TestReport``."""
 
@@ -198,12 +424,6 @@ class TestReportSchema(Schema):
     @post_load
     def make_test_report(self, data):  # pylint: disable=no-self-use
         """Create report object & deserialize sub trees."""
-        load_tree = functools.partial(
-            load_tree_data,
-            node_schema=TestGroupReportSchema,
-            leaf_schema=TestCaseReportSchema,
-        )
-
         entry_data = data.pop("entries")
         status_override = data.pop("status_override")
         status = data.pop("status")
@@ -213,7 +433,9 @@ class TestReportSchema(Schema):
         logs = data.pop("logs", [])
 
         test_plan_report = TestReport(**data)
-        test_plan_report.entries = [load_tree(c_data) for c_data in entry_data]
+        test_plan_report.entries = [
+            _load_test_tree(c_data) for c_data in entry_data
+        ]
         test_plan_report.propagate_tag_indices()
 
         test_plan_report.status_override = status_override
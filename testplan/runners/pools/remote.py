@@ -2,14 +2,19 @@
 
 import os
 import sys
+import stat
 import signal
 import socket
-import getpass
+import hashlib
+import threading
+import subprocess
 import platform
 import itertools
+import functools
+import concurrent.futures
 from multiprocessing.pool import ThreadPool
 
-from schema import Or
+from schema import Or, And
 
 import testplan
 from testplan.common.utils.logger import TESTPLAN_LOGGER
@@ -23,8 +28,15 @@ from testplan.common.utils.path import (
 )
 from testplan.common.utils.strings import slugify
 from testplan.common.utils.remote import (
+    current_user,
     ssh_cmd,
+    ssh_master_cmd,
+    ssh_check_cmd,
+    ssh_exit_cmd,
+    ssh_control_path,
+    shell_quote,
     copy_cmd,
+    rsync_cmd,
     link_cmd,
     remote_filepath_exists,
 )
@@ -54,6 +66,29 @@ class WorkerSetupMetadata(object):
         self.workspace_pushed = False
 
 
+# Distinguishes the ssh master connections of workers in this process.
+_SSH_CONTROL_IDS = itertools.count()
+
+
+def _shell_join(cmd):
+    """Join command arguments into a string escaped for the remote shell."""
+    return " ".join(shell_quote(arg) for arg in cmd)
+
+
+@functools.lru_cache(maxsize=None)
+def _testplan_import_path():
+    """Local directory testplan package is imported from."""
+    return os.path.dirname(os.path.dirname(module_abspath(testplan)))
+
+
+@functools.lru_cache(maxsize=None)
+def _remote_python_binary():
+    """Python interpreter used to start the child process on remote host."""
+    if platform.system() == "Windows":
+        return os.environ["PYTHON3_REMOTE_BINARY"]
+    return sys.executable
+
+
 class RemoteWorkerConfig(ProcessWorkerConfig):
     """
     Configuration object for
@@ -101,7 +136,7 @@ class RemoteWorker(ProcessWorker):
     def __init__(self, **options):
         super(RemoteWorker, self).__init__(**options)
         self._remote_testplan_path = None
-        self._user = getpass.getuser()
+        self._user = current_user()
         self._workspace_paths = _LocationPaths()
         self._child_paths = _LocationPaths()
         self._working_dirs = _LocationPaths()
@@ -110,6 +145,7 @@ class RemoteWorker(ProcessWorker):
         self.setup_metadata = WorkerSetupMetadata()
         self.remote_push_dir = None
         self.ssh_cfg = {"host": self.cfg.remote_host}
+        self._ssh_control_id = next(_SSH_CONTROL_IDS)
         self._testplan_import_path = _LocationPaths()
 
     def _execute_cmd_remote(self, cmd, label=None, check=True):
@@ -122,7 +158,7 @@ class RemoteWorker(ProcessWorker):
                       See self._execute_cmd for more detail.
         """
         execute_cmd(
-            self.cfg.ssh_cmd(self.ssh_cfg, " ".join([str(a) for a in cmd])),
+            self.cfg.ssh_cmd(self.ssh_cfg, _shell_join(cmd)),
             label=label,
             check=check,
             logger=self.logger,
@@ -132,15 +168,19 @@ class RemoteWorker(ProcessWorker):
         """
         Create a directory path on the remote host.
 
-        :param remote_dir: Path to create.
+        :param remote_dir: Path to create, or list of paths to create with a
+            single command.
         :param label: Optional debug label.
         """
         if not label:
             label = "remote mkdir"
 
-        cmd = self.cfg.remote_mkdir + [remote_dir]
+        if isinstance(remote_dir, list):
+            cmd = self.cfg.remote_mkdir + remote_dir
+        else:
+            cmd = self.cfg.remote_mkdir + [remote_dir]
         execute_cmd(
-            self.cfg.ssh_cmd(self.ssh_cfg, " ".join([str(a) for a in cmd])),
+            self.cfg.ssh_cmd(self.ssh_cfg, _shell_join(cmd)),
             label=label,
             logger=self.logger,
         )
@@ -148,25 +188,22 @@ class RemoteWorker(ProcessWorker):
     def _define_remote_dirs(self):
         """Define mandatory directories in remote host."""
 
-        runpath = os.path.join(self.parent.runpath)
-        runpath_parts = runpath.split(os.sep)
-
         # We are not using os.path.join directly in case we are running
         # remote pool from Windows -> Linux hosts
-        self._remote_testplan_path = "/".join(
-            runpath_parts
-            + ["remote_testplan_lib", slugify(self.cfg.parent.parent.name)]
+        runpath = "/".join(self.parent.runpath.split(os.sep))
+
+        self._remote_testplan_path = "{}/remote_testplan_lib/{}".format(
+            runpath, self.parent.plan_slug
         )
-        self._remote_testplan_runpath = "/".join(
-            runpath_parts
-            + ["remote_testplan_runpath", str(self.cfg.remote_host)]
+        self._remote_testplan_runpath = "{}/remote_testplan_runpath/{}".format(
+            runpath, self.cfg.remote_host
         )
 
     def _create_remote_dirs(self):
         """Create mandatory directories in remote host."""
         cmd = self.cfg.remote_mkdir + [self._remote_testplan_path]
         execute_cmd(
-            self.cfg.ssh_cmd(self.ssh_cfg, " ".join([str(a) for a in cmd])),
+            self.cfg.ssh_cmd(self.ssh_cfg, _shell_join(cmd)),
             label="create remote dirs",
             logger=self.logger,
         )
@@ -188,13 +225,35 @@ class RemoteWorker(ProcessWorker):
             return
         local_path = "{}/dependencies.py".format(path)
         remote_path = "{}/dependencies.py".format(self._remote_testplan_path)
-        self._transfer_data(
-            source=local_path, target=remote_path, remote_target=True
+        self._transfer_file_if_changed(source=local_path, target=remote_path)
+
+    def _transfer_file_if_changed(self, source, target):
+        """
+        Copy a single file to the remote host, unless the target already has
+        the same checksum. The check is a single ssh call, if ``sha256sum``
+        is not available on the remote host the file is always copied.
+        """
+        with open(source, "rb") as source_file:
+            digest = hashlib.sha256(source_file.read()).hexdigest()
+
+        # sha256sum prints "<digest>  -" for data read from stdin
+        cmd = self.cfg.ssh_cmd(
+            self.ssh_cfg,
+            'test "$(sha256sum 2>/dev/null < {})" = "{}  -"'.format(
+                shell_quote(target), digest
+            ),
         )
+        if 0 == execute_cmd(
+            cmd, label="remote checksum check", check=False, logger=self.logger
+        ):
+            self.logger.debug("%s is up to date on remote host", target)
+            return
+
+        self._transfer_data(source=source, target=target, remote_target=True)
 
     def _get_testplan_import_path(self):
 
-        return os.path.dirname(os.path.dirname(module_abspath(testplan)))
+        return _testplan_import_path()
 
     def _copy_testplan_package(self):
         """Make testplan package available on remote host"""
@@ -291,21 +350,37 @@ class RemoteWorker(ProcessWorker):
         push_dirs = []
 
         for source, dest in push_locations:
-            source = source.rstrip(os.sep)
-            if os.path.isfile(source):
+            source = os.path.normpath(source)
+            try:
+                mode = os.stat(source).st_mode
+            except OSError:
+                mode = 0
+            if stat.S_ISREG(mode):
                 push_files.append(_LocationPaths(source, dest))
-            elif os.path.isdir(source):
+            elif stat.S_ISDIR(mode):
                 push_dirs.append(_LocationPaths(source, dest))
             else:
                 self.logger.error('Item "{}" cannot be pushed!'.format(source))
 
-        # Eliminate push duplications
-        if push_dirs and len(push_dirs) > 1:
-            push_dirs.sort(key=lambda x: x.local)
-            for idx in range(len(push_dirs) - 1):
-                if push_dirs[idx + 1].local.startswith(push_dirs[idx].local):
-                    push_dirs[idx] = None
-            push_dirs = [_dir for _dir in push_dirs if _dir is not None]
+        # Eliminate push duplications, sub-directories are dropped when they
+        # would be pushed along with their parent anyway. Sorting on path
+        # components keeps each directory right before its sub-directories.
+        if len(push_dirs) > 1:
+            push_dirs.sort(key=lambda x: x.local.split(os.sep))
+            unique_dirs = []
+            root = None
+            for push_dir in push_dirs:
+                if (
+                    root is not None
+                    and push_dir.local.startswith(root.local + os.sep)
+                    and push_dir.remote.startswith(
+                        root.remote.rstrip("/") + "/"
+                    )
+                ):
+                    continue
+                unique_dirs.append(push_dir)
+                root = push_dir
+            push_dirs = unique_dirs
 
         return push_files, push_dirs
 
@@ -366,20 +441,47 @@ class RemoteWorker(ProcessWorker):
         Push files and directories to the remote host. Both the source and
         destination paths should be specified.
 
+        Entries keeping their local name under the same remote directory are
+        copied with a single command when the default copy commands are used.
+
         :param push_files: Files to push.
         :param push_dirs:  Directories to push.
         """
+        by_remote_dir = {}
         for source, dest in itertools.chain(push_files, push_dirs):
             remote_dir = dest.rpartition("/")[0]
-            self.logger.debug("Create remote dir: %s", remote_dir)
-            self._mkdir_remote(remote_dir)
+            by_remote_dir.setdefault(remote_dir, []).append((source, dest))
+
+        if by_remote_dir:
+            self.logger.debug("Create remote dirs: %s", list(by_remote_dir))
+            self._mkdir_remote(list(by_remote_dir))
+
+        for remote_dir, locations in by_remote_dir.items():
+            if self._batch_copy:
+                batch = [
+                    (source, dest)
+                    for source, dest in locations
+                    if dest.rpartition("/")[2] == os.path.basename(source)
+                ]
+            else:
+                batch = []
 
-            self._transfer_data(
-                source=source,
-                target=dest,
-                remote_target=True,
-                exclude=self.cfg.push_exclude,
-            )
+            if len(batch) > 1:
+                self._transfer_data(
+                    source=[source for source, _ in batch],
+                    target="{}/".format(remote_dir),
+                    remote_target=True,
+                    exclude=self.cfg.push_exclude,
+                )
+                locations = [loc for loc in locations if loc not in batch]
+
+            for source, dest in locations:
+                self._transfer_data(
+                    source=source,
+                    target=dest,
+                    remote_target=True,
+                    exclude=self.cfg.push_exclude,
+                )
 
     def _copy_workspace(self):
         """Make the local workspace available on remote host."""
@@ -398,7 +500,7 @@ class RemoteWorker(ProcessWorker):
             execute_cmd(
                 self.cfg.ssh_cmd(
                     self.ssh_cfg,
-                    " ".join(
+                    _shell_join(
                         self.cfg.link_cmd(
                             path=fix_home_prefix(self.cfg.remote_workspace),
                             link=self._workspace_paths.remote,
@@ -442,7 +544,7 @@ class RemoteWorker(ProcessWorker):
             execute_cmd(
                 self.cfg.ssh_cmd(
                     self.ssh_cfg,
-                    " ".join(
+                    _shell_join(
                         self.cfg.link_cmd(
                             path=self._workspace_paths.local,
                             link=self._workspace_paths.remote,
@@ -462,6 +564,11 @@ class RemoteWorker(ProcessWorker):
             user=self._user, host=self.cfg.remote_host, path=path
         )
 
+    @property
+    def _batch_copy(self):
+        """Whether one copy command can transfer several sources."""
+        return self.cfg.copy_cmd in (copy_cmd, rsync_cmd)
+
     def _transfer_data(
         self,
         source,
@@ -471,18 +578,22 @@ class RemoteWorker(ProcessWorker):
         **copy_args
     ):
         if remote_source:
-            source = self._remote_copy_path(source)
+            if isinstance(source, list):
+                source = [self._remote_copy_path(path) for path in source]
+            else:
+                source = self._remote_copy_path(source)
         if remote_target:
             target = self._remote_copy_path(target)
         self.logger.debug("Copying %(source)s to %(target)s", locals())
+        if self._batch_copy and "control_path" in self.ssh_cfg:
+            copy_args["control_path"] = self.ssh_cfg["control_path"]
         cmd = self.cfg.copy_cmd(source, target, **copy_args)
-        with open(os.devnull, "w") as devnull:
-            execute_cmd(
-                cmd,
-                "transfer data [..{}]".format(os.path.basename(target)),
-                stdout=devnull,
-                logger=self.logger,
-            )
+        execute_cmd(
+            cmd,
+            "transfer data [..{}]".format(os.path.basename(target)),
+            stdout=subprocess.DEVNULL,
+            logger=self.logger,
+        )
 
     @property
     def _remote_working_dir(self):
@@ -513,11 +624,31 @@ class RemoteWorker(ProcessWorker):
     def _prepare_remote(self):
         """Transfer local data to remote host."""
 
-        self._define_remote_dirs()
-        self._create_remote_dirs()
-        self._copy_workspace()
-        self._copy_testplan_package()
-        self._copy_dependencies_module()
+        # Every step runs its remote commands one after the other, holding
+        # a pool wide slot caps the connections opened to all hosts at once.
+        setup_slots = self.parent.setup_slots
+
+        def run_step(step):
+            with setup_slots:
+                step()
+
+        with setup_slots:
+            self._open_ssh_master()
+            self._define_remote_dirs()
+            self._create_remote_dirs()
+
+        # Transfers are independent of each other and mostly wait on the
+        # network, so run them concurrently.
+        steps = (
+            self._copy_workspace,
+            self._copy_testplan_package,
+            self._copy_dependencies_module,
+            self._push_files,
+        )
+        with concurrent.futures.ThreadPoolExecutor(len(steps)) as executor:
+            for future in [executor.submit(run_step, step) for step in steps]:
+                future.result()
+
         self._set_child_script()
 
         self._working_dirs.local = pwd()
@@ -526,25 +657,36 @@ class RemoteWorker(ProcessWorker):
             "Remote working path = %s", self._working_dirs.remote
         )
 
-        self._push_files()
         self.setup_metadata.setup_script = self.cfg.setup_script
         self.setup_metadata.env = self.cfg.env
         self.setup_metadata.workspace_paths = self._workspace_paths
 
     def _pull_files(self):
-        """Push custom files to be available on remotes."""
+        """
+        Pull custom files from remotes, entries going to the same local
+        directory are copied with a single command if possible.
+        """
+        by_local_dir = {}
         for entry in [itm.rstrip("/") for itm in self.cfg.pull]:
             # Prepare target path for possible windows usage.
             dirname = os.sep.join(os.path.dirname(entry).split("/"))
+            by_local_dir.setdefault(dirname, []).append(entry)
+
+        for dirname, entries in by_local_dir.items():
             try:
                 makedirs(dirname)
             except Exception as exc:
                 self.logger.error(
                     "Cound not create {} directory - {}".format(dirname, exc)
                 )
-            else:
+                continue
+
+            if self._batch_copy and len(entries) > 1:
+                entries = [entries]
+
+            for source in entries:
                 self._transfer_data(
-                    source=entry,
+                    source=source,
                     remote_source=True,
                     target=dirname,
                     exclude=self.cfg.pull_exclude,
@@ -567,14 +709,8 @@ class RemoteWorker(ProcessWorker):
             )
 
     def _proc_cmd_impl(self):
-        if platform.system() == "Windows":
-            python_binary = os.environ["PYTHON3_REMOTE_BINARY"]
-
-        else:
-            python_binary = sys.executable
-
         cmd = [
-            python_binary,
+            _remote_python_binary(),
             "-uB",
             self._child_paths.remote,
             "--index",
@@ -608,12 +744,13 @@ class RemoteWorker(ProcessWorker):
         """Command to start child process."""
 
         cmd = self._proc_cmd_impl()
-        return self.cfg.ssh_cmd(self.ssh_cfg, " ".join(cmd))
+        return self.cfg.ssh_cmd(self.ssh_cfg, _shell_join(cmd))
 
     def _write_syspath(self):
         """
         Write our current sys.path to a file and transfer it to the remote
-        host.
+        host. The child removes the file once read, so it is transferred
+        again on every start.
         """
         local_syspath_filepath = super(RemoteWorker, self)._write_syspath()
         remote_syspath_filepath = os.path.join(
@@ -664,6 +801,52 @@ class RemoteWorker(ProcessWorker):
 
         return sys_path
 
+    @property
+    def _multiplex_ssh(self):
+        """Whether the default ssh command is used and can share a master."""
+        return self.cfg.ssh_cmd is ssh_cmd and os.name != "nt"
+
+    def _open_ssh_master(self):
+        """
+        Start the master connection later ssh and copy commands reuse. Each
+        worker owns its master, other workers connected to the same host are
+        not affected when it is closed.
+        """
+        if not self._multiplex_ssh:
+            return
+        self.ssh_cfg["control_path"] = ssh_control_path(self._ssh_control_id)
+        if 0 == execute_cmd(
+            ssh_check_cmd(self.ssh_cfg),
+            label="check ssh master connection",
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            logger=self.logger,
+        ):
+            return
+        execute_cmd(
+            ssh_master_cmd(self.ssh_cfg),
+            label="open ssh master connection",
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            logger=self.logger,
+        )
+
+    def _close_ssh_master(self):
+        """Close the master connection opened on setup."""
+        if "control_path" not in self.ssh_cfg:
+            return
+        execute_cmd(
+            ssh_exit_cmd(self.ssh_cfg),
+            label="close ssh master connection",
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            logger=self.logger,
+        )
+        del self.ssh_cfg["control_path"]
+
     def starting(self):
         """Start a child remote worker."""
         self._prepare_remote()
@@ -673,6 +856,7 @@ class RemoteWorker(ProcessWorker):
         """Stop child process worker."""
         self._fetch_results()
         super(RemoteWorker, self).stopping()
+        self._close_ssh_master()
 
     def _wait_stopped(self, timeout=None):
         sleeper = get_sleeper(1, timeout)
@@ -693,6 +877,7 @@ class RemoteWorker(ProcessWorker):
         except Exception as exc:
             self.logger.error("Could not fetch results, {}".format(exc))
         super(RemoteWorker, self).aborting()
+        self._close_ssh_master()
 
 
 class RemotePoolConfig(PoolConfig):
@@ -739,6 +924,9 @@ class RemotePoolConfig(PoolConfig):
             ConfigOption("remote_mkdir", default=["/bin/mkdir", "-p"]): list,
             ConfigOption("testplan_path", default=None): Or(str, None),
             ConfigOption("worker_heartbeat", default=30): Or(int, float, None),
+            ConfigOption("max_parallel_setup", default=10): And(
+                int, lambda x: x > 0
+            ),
         }
 
 
@@ -766,7 +954,9 @@ class RemotePool(Pool):
     :type host: ``str``
     :param port: Port that pool binds. Default: 0 (random)
     :type port: ``int``
-    :param copy_cmd: Creates the remote copy command.
+    :param copy_cmd: Creates the remote copy command. Pass
+        :py:func:`~testplan.common.utils.remote.rsync_cmd` to always use
+        incremental rsync transfers.
     :type copy_cmd: ``callable``
     :param link_cmd: Creates the solf link command.
     :type link_cmd: ``callable``
@@ -777,6 +967,8 @@ class RemotePool(Pool):
     :param workspace_exclude: Patterns to exclude files when pushing workspace.
     :type workspace_exclude: ``list`` of ``str``
     :param remote_workspace: Use a workspace that already exists in remote host.
+        Remote paths are quoted for the remote shell, only a leading ``~`` is
+        expanded, environment variables such as ``$HOME`` are not.
     :type remote_workspace: ``str``
     :param copy_workspace_check: Check to indicate whether to copy workspace.
     :type copy_workspace_check: ``callable`` or ``NoneType``
@@ -784,7 +976,8 @@ class RemotePool(Pool):
     :type env: ``dict``
     :param setup_script: Script to be executed on remote as very first thing.
     :type setup_script: ``list`` of ``str``
-    :param push: Files and directories to push to the remote.
+    :param push: Files and directories to push to the remote. Destinations
+        follow the same quoting rules as ``remote_workspace``.
     :type push: ``list`` of ``str``
     :param push_exclude: Patterns to exclude files on push stage.
     :type push_exclude: ``list`` of ``str``
@@ -796,10 +989,15 @@ class RemotePool(Pool):
     :type pull_exclude: ``list`` of ``str``
     :param remote_mkdir: Command to make directories in remote worker.
     :type remote_mkdir: ``list`` of ``str``
-    :param testplan_path: Path to import testplan from on remote host.
+    :param testplan_path: Path to import testplan from on remote host. Follows
+        the same quoting rules as ``remote_workspace``.
     :type testplan_path: ``str``
     :param worker_heartbeat: Worker heartbeat period.
     :type worker_heartbeat: ``int`` or ``float`` or ``NoneType``
+    :param max_parallel_setup: Maximum number of setup steps, each running
+        ssh / copy commands, in progress across all remote hosts at the same
+        time. Keep it within sshd ``MaxStartups`` of the hosts. Default: 10
+    :type max_parallel_setup: ``int``
 
     Also inherits all :py:class:`~testplan.runners.pools.base.Pool` options.
     """
@@ -835,6 +1033,7 @@ class RemotePool(Pool):
         remote_mkdir=None,
         testplan_path=None,
         worker_heartbeat=30,
+        max_parallel_setup=10,
         **options
     ):
         self.pool = None
@@ -846,6 +1045,10 @@ class RemotePool(Pool):
         ] = self._worker_setup_metadata
 
         self._instances = {}
+        self._plan_slug = None
+        self._setup_slots = threading.BoundedSemaphore(
+            self.cfg.max_parallel_setup
+        )
 
         for host, number_of_workers in self.cfg.hosts.items():
             self._instances[host] = {
@@ -853,6 +1056,18 @@ class RemotePool(Pool):
                 "number_of_workers": number_of_workers,
             }
 
+    @property
+    def plan_slug(self):
+        """Slugified name of the plan, shared by the remote worker paths."""
+        if self._plan_slug is None:
+            self._plan_slug = slugify(self.cfg.parent.name)
+        return self._plan_slug
+
+    @property
+    def setup_slots(self):
+        """Semaphore limiting concurrent setup steps of the remote workers."""
+        return self._setup_slots
+
     @staticmethod
     def _worker_setup_metadata(worker, request, response):
         worker.respond(
@@ -892,8 +1107,9 @@ class RemotePool(Pool):
     def _start_thread_pool(self):
         size = len(self._instances)
         try:
-            if size > 2:
-                self.pool = ThreadPool(5 if size > 5 else size)
+            # Remote hosts are set up concurrently, one thread each.
+            if size > 1:
+                self.pool = ThreadPool(size)
         except Exception as exc:
             if isinstance(exc, AttributeError):
                 self.logger.warning(
@@ -10,16 +10,46 @@ from .. import base
 
 
 class AssertionSchemaRegistry(SchemaRegistry):
+    def __init__(self):
+        super(AssertionSchemaRegistry, self).__init__()
+        self._schemas_by_type = {}
+
     def get_category(self, obj):
         return obj.meta_type
 
+    def __getitem__(self, item):
+        # ``meta_type`` is a class attribute, so the schema of an entry
+        # only depends on its type.
+        item_type = type(item)
+        try:
+            return self._schemas_by_type[item_type]
+        except KeyError:
+            schema = super(AssertionSchemaRegistry, self).__getitem__(item)
+            self._schemas_by_type[item_type] = schema
+            return schema
+
+    def __setitem__(self, key, value):
+        super(AssertionSchemaRegistry, self).__setitem__(key, value)
+        self._schemas_by_type.clear()
+
+    def bind_default(self, category=None):
+        bind = super(AssertionSchemaRegistry, self).bind_default(category)
+
+        def wrapper(value):
+            value = bind(value)
+            self._schemas_by_type.clear()
+            return value
+
+        return wrapper
+
 
 registry = AssertionSchemaRegistry()
 
 
 class GenericEntryList(fields.Field):
     def _serialize(self, value, attr, obj):
-        return [registry.serialize(entry) for entry in value]
+        serialize = registry.serialize
+        return [serialize(entry) for entry in value]
 
 
 @registry.bind_default()
@@ -65,7 +95,7 @@ class MarkdownSchema(BaseSchema):
 
 @registry.bind(base.TableLog)
 class TableLogSchema(BaseSchema):
-    table = fields.List(fields.List(custom_fields.NativeOrPretty()))
+    table = custom_fields.NativeOrPrettyTable()
     indices = fields.List(fields.Integer(), allow_none=True)
     display_index = fields.Boolean()
     columns = fields.List(fields.String(), allow_none=False)
@@ -4,6 +4,7 @@ import re
 import argparse
 import functools
 import collections
+import collections.abc
 
 
 SAMPLE_ARGUMENTS = """tag1 tag2 tagname1=tag3,tag4 tagname2=tag5,tag6"""
@@ -92,7 +93,7 @@ def validate_tag_value(tag_value):
         """Make sure tag value is either a string or an iterable of strings."""
         if isinstance(value, str):
             return {_validate_tag_value_string(value)}
-        elif isinstance(value, collections.Iterable):
+        elif isinstance(value, collections.abc.Iterable):
             return {_validate_tag_value_string(tag) for tag in value}
         raise ValueError(
             (
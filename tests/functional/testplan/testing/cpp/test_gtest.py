@@ -22,26 +22,26 @@ You need to compile the files at "{binary_dir}" to be able to run this test.
 
 @skip_on_windows(reason="GTest is skipped on Windows.")
 @pytest.mark.parametrize(
-    "binary_dir, expected_report, report_status",
+    "binary_dir, report_module, report_status",
     (
         (
             os.path.join(fixture_root, "failing"),
-            gtest.failing.report.expected_report,
+            gtest.failing.report,
             Status.FAILED,
         ),
         (
             os.path.join(fixture_root, "passing"),
-            gtest.passing.report.expected_report,
+            gtest.passing.report,
             Status.PASSED,
         ),
         (
             os.path.join(fixture_root, "empty"),
-            gtest.empty.report.expected_report,
+            gtest.empty.report,
             Status.PASSED,
         ),
     ),
 )
-def test_gtest(mockplan, binary_dir, expected_report, report_status):
+def test_gtest(mockplan, binary_dir, report_module, report_status):
 
     binary_path = os.path.join(binary_dir, "runTests")
 
@@ -55,7 +55,10 @@ def test_gtest(mockplan, binary_dir, expected_report, report_status):
 
     assert mockplan.run().run is True
 
-    check_report(expected=expected_report, actual=mockplan.report)
+    # Expected reports may be built lazily, only resolve them when needed
+    check_report(
+        expected=report_module.expected_report, actual=mockplan.report
+    )
 
     assert mockplan.report.status == report_status
 
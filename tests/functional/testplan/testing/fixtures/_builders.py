@@ -0,0 +1,13 @@
+"""Shorthand constructors for expected report trees in fixture modules."""
+
+from testplan.report import TestGroupReport, TestCaseReport
+
+
+def group(name, category, entries):
+    """Expected :py:class:`~testplan.report.testing.base.TestGroupReport`."""
+    return TestGroupReport(name=name, category=category, entries=entries)
+
+
+def case(name, entries):
+    """Expected :py:class:`~testplan.report.testing.base.TestCaseReport`."""
+    return TestCaseReport(name=name, entries=entries)
@@ -1,69 +1,122 @@
-from testplan.report import TestReport, TestGroupReport, TestCaseReport
+import os
+import sys
+import pickle
+import functools
 
-expected_report = TestReport(
-    name="plan",
-    entries=[
-        TestGroupReport(
-            name="My GTest",
-            category="gtest",
-            entries=[
-                TestGroupReport(
-                    name="SquareRootTest",
-                    category="testsuite",
-                    entries=[
-                        TestCaseReport(
-                            name="PositiveNos",
-                            entries=[
-                                {"type": "RawAssertion", "passed": True},
-                            ],
-                        ),
-                        TestCaseReport(
-                            name="NegativeNos",
-                            entries=[
-                                {"type": "RawAssertion", "passed": True},
-                            ],
-                        ),
-                    ],
-                ),
-                TestGroupReport(
-                    name="SquareRootTestNonFatal",
-                    category="testsuite",
-                    entries=[
-                        TestCaseReport(
-                            name="PositiveNos",
-                            entries=[
-                                {"type": "RawAssertion", "passed": True},
-                            ],
-                        ),
-                        TestCaseReport(
-                            name="NegativeNos",
-                            entries=[
-                                {"type": "RawAssertion", "passed": True},
-                            ],
-                        ),
-                    ],
-                ),
-                TestGroupReport(
-                    name="ProcessChecks",
-                    category="testsuite",
-                    entries=[
-                        TestCaseReport(
-                            name="ExitCodeCheck",
-                            entries=[
-                                {"type": "RawAssertion", "passed": True},
-                                {
-                                    "type": "Attachment",
-                                    "description": "Process stdout",
-                                },
-                                {
-                                    "type": "Attachment",
-                                    "description": "Process stderr",
-                                },
-                            ],
-                        ),
-                    ],
-                ),
-            ],
+from testplan.report import TestReport
+from testplan.report.testing import base as report_base
+from testplan.testing.multitest.entries import base as entries_base
+
+from tests.functional.testplan.testing.fixtures import _builders
+from tests.functional.testplan.testing.fixtures._builders import group, case
+
+# Shared by all passing entries, check_report only reads expected entries
+_PASS_RAW = {"type": "RawAssertion", "passed": True}
+
+_CACHE_PATH = "{}.pkl".format(os.path.splitext(__file__)[0])
+
+
+def _cache_key():
+    """
+    Pickled reports are only valid for the same interpreter and the same
+    sources of this fixture and the classes it is built from.
+    """
+    return (sys.version_info[:2],) + tuple(
+        os.path.getmtime(module.__file__)
+        for module in (
+            sys.modules[__name__],
+            _builders,
+            report_base,
+            entries_base,
         )
-    ],
-)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_expected_report():
+    """
+    Build the expected report on first use, later calls reuse it.
+
+    If ``TESTPLAN_FIXTURE_CACHE=1`` is set the report is also pickled next to
+    this file and reloaded by later sessions until any of its sources change.
+    """
+    if os.environ.get("TESTPLAN_FIXTURE_CACHE") != "1":
+        return _build_expected_report()
+
+    key = _cache_key()
+    try:
+        with open(_CACHE_PATH, "rb") as cache_file:
+            # Key is checked before unpickling objects of stale classes
+            if pickle.load(cache_file) == key:
+                return pickle.load(cache_file)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    report = _build_expected_report()
+    tmp_path = "{}.{}".format(_CACHE_PATH, os.getpid())
+    try:
+        with open(tmp_path, "wb") as cache_file:
+            pickle.dump(key, cache_file)
+            pickle.dump(report, cache_file)
+        os.replace(tmp_path, _CACHE_PATH)
+    except OSError:
+        pass
+    return report
+
+
+def _build_expected_report():
+    return TestReport(
+        name="plan",
+        entries=[
+            group(
+                "My GTest",
+                "gtest",
+                [
+                    group(
+                        "SquareRootTest",
+                        "testsuite",
+                        [
+                            case("PositiveNos", [_PASS_RAW]),
+                            case("NegativeNos", [_PASS_RAW]),
+                        ],
+                    ),
+                    group(
+                        "SquareRootTestNonFatal",
+                        "testsuite",
+                        [
+                            case("PositiveNos", [_PASS_RAW]),
+                            case("NegativeNos", [_PASS_RAW]),
+                        ],
+                    ),
+                    group(
+                        "ProcessChecks",
+                        "testsuite",
+                        [
+                            case(
+                                "ExitCodeCheck",
+                                [
+                                    _PASS_RAW,
+                                    {
+                                        "type": "Attachment",
+                                        "description": "Process stdout",
+                                    },
+                                    {
+                                        "type": "Attachment",
+                                        "description": "Process stderr",
+                                    },
+                                ],
+                            ),
+                        ],
+                    ),
+                ],
+            )
+        ],
+    )
+
+
+def __getattr__(name):
+    if name == "expected_report":
+        return get_expected_report()
+    raise AttributeError(
+        "module {!r} has no attribute {!r}".format(__name__, name)
+    )
@@ -1,7 +1,14 @@
 """
 Unit tests for the testplan.common.serialization.fields module.
 """
+
+import datetime
+import re
+from decimal import Decimal
+
+import marshmallow
 import pytest
+import pytz
 
 from testplan.common.serialization import fields
 
@@ -70,3 +77,57 @@ class TestNativeOrPretty(object):
         """
         serialized = native_or_pretty.serialize("unpickleable", targets)
         assert serialized == "UnPickleableInt[42]"
+
+
+class TestUTCDateTime(object):
+    @pytest.mark.parametrize(
+        "value",
+        (
+            datetime.datetime(2020, 1, 2, 3, 4, 5, 678),
+            datetime.datetime(2020, 1, 2, 3, 4, 5),
+            datetime.datetime(2020, 1, 2, 3, 4, 5, 678, tzinfo=pytz.UTC),
+            datetime.datetime(
+                2020, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc
+            ),
+            pytz.timezone("Europe/London").localize(
+                datetime.datetime(2020, 7, 2, 3, 4, 5, 678)
+            ),
+        ),
+    )
+    def test_serialize(self, value):
+        """Output should match marshmallow's ISO formatting."""
+        expected = marshmallow.fields.DateTime().serialize(
+            "value", {"value": value}
+        )
+        serialized = fields.UTCDateTime().serialize("value", {"value": value})
+        assert serialized == expected
+
+    def test_round_trip(self):
+        """Serialized values should deserialize to the same UTC datetime."""
+        field = fields.UTCDateTime()
+        value = datetime.datetime(2020, 1, 2, 3, 4, 5, 678, tzinfo=pytz.UTC)
+        serialized = field.serialize("value", {"value": value})
+        assert field.deserialize(serialized) == value
+
+
+class TestNativeOrPrettyTable(object):
+    @pytest.mark.parametrize(
+        "table",
+        (
+            [[1, "a", None, 1.5, True], [b"b", 2, "c", None, False]],
+            [[{"a": 1}, [1, 2], (3,)], [re.compile("abc"), len, Decimal(1)]],
+            [[fields.LogLink("http://link", title="link")]],
+            [(1, 2), "row"],
+            [],
+            None,
+        ),
+    )
+    def test_serialize(self, table):
+        """Should get the same output as nested NativeOrPretty lists."""
+        nested = marshmallow.fields.List(
+            marshmallow.fields.List(fields.NativeOrPretty())
+        )
+        field = fields.NativeOrPrettyTable()
+        assert field.serialize("t", {"t": table}) == nested.serialize(
+            "t", {"t": table}
+        )
@@ -0,0 +1,60 @@
+import sys
+import logging
+import time
+import subprocess
+
+import pytest
+
+from testplan.common.utils.process import execute_cmd, kill_process
+
+
+class TestKillProcess(object):
+    def test_terminate(self):
+        """Should return as soon as the process exits on terminate."""
+        proc = subprocess.Popen(
+            [sys.executable, "-c", "import time; time.sleep(30)"]
+        )
+        start = time.monotonic()
+        retcode = kill_process(proc, timeout=10)
+        assert retcode is not None
+        assert time.monotonic() - start < 5
+
+    def test_exited(self):
+        """Should return the exit code of a process that already exited."""
+        proc = subprocess.Popen([sys.executable, "-c", "exit(3)"])
+        proc.wait()
+        assert kill_process(proc) == 3
+
+
+class TestExecuteCmd(object):
+    def test_stdin(self):
+        """Should not let the command read from our stdin."""
+        assert 0 == execute_cmd(
+            [sys.executable, "-c", "import sys; assert not sys.stdin.read()"]
+        )
+
+    def test_check(self):
+        """Should raise on a non-zero exit code only if asked to."""
+        cmd = [sys.executable, "-c", "exit(2)"]
+        assert execute_cmd(cmd, check=False) == 2
+        with pytest.raises(RuntimeError):
+            execute_cmd(cmd)
+
+    def test_debug_log(self):
+        """Should only log commands and timings when debugging."""
+        logger = logging.getLogger("test_execute_cmd")
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        logger.addHandler(handler)
+        cmd = [sys.executable, "-c", "pass"]
+        try:
+            logger.setLevel(logging.INFO)
+            execute_cmd(cmd, label="quiet", logger=logger)
+            assert records == []
+
+            logger.setLevel(logging.DEBUG)
+            execute_cmd(cmd, label="loud", logger=logger)
+            assert [record.args[0] for record in records] == ["loud", "loud"]
+        finally:
+            logger.removeHandler(handler)
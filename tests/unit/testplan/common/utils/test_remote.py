@@ -0,0 +1,147 @@
+import pytest
+
+from testplan.common.utils import remote
+
+CONTROL_PATH = "/tmp/tp-1-0-%C"
+
+
+class TestCopyCmd(object):
+    def test_rsync(self, monkeypatch):
+        """Should build an incremental rsync command if rsync is set."""
+        monkeypatch.setenv("RSYNC_BINARY", "/usr/bin/rsync")
+        monkeypatch.delenv("SSH_BINARY", raising=False)
+        cmd = remote.copy_cmd(
+            "/src", "host:/dst", exclude=["*.pyc"], control_path=CONTROL_PATH
+        )
+        assert cmd == [
+            "/usr/bin/rsync",
+            "-rtz",
+            "-l",
+            "--partial",
+            "--exclude=*.pyc",
+            "-e",
+            "ssh -o ControlPath={}".format(CONTROL_PATH),
+            "/src",
+            "host:/dst",
+        ]
+
+    def test_rsync_port(self, monkeypatch):
+        """Should pass the port through to the ssh transport."""
+        monkeypatch.setenv("RSYNC_BINARY", "/usr/bin/rsync")
+        monkeypatch.setenv("SSH_BINARY", "/usr/bin/ssh")
+        cmd = remote.copy_cmd("/src", "host:/dst", port=22, deref_links=True)
+        assert cmd[2] == "-L"
+        assert cmd[-4:-2] == ["-e", "/usr/bin/ssh -p 22"]
+
+    @pytest.mark.parametrize("port", (None, 22))
+    def test_scp(self, monkeypatch, port):
+        """Should fall back to scp if rsync is not set."""
+        monkeypatch.delenv("RSYNC_BINARY", raising=False)
+        monkeypatch.setenv("SCP_BINARY", "/usr/bin/scp")
+        cmd = remote.copy_cmd(
+            "/src", "host:/dst", port=port, control_path=CONTROL_PATH
+        )
+        expected = ["/usr/bin/scp", "-r"]
+        expected.extend(remote.ssh_control_options(CONTROL_PATH))
+        if port is not None:
+            expected.extend(["-P", port])
+        assert cmd == expected + ["/src", "host:/dst"]
+
+    @pytest.mark.parametrize("rsync", (True, False))
+    def test_multiple_sources(self, monkeypatch, rsync):
+        """Should copy all sources into the target with one command."""
+        if rsync:
+            monkeypatch.setenv("RSYNC_BINARY", "/usr/bin/rsync")
+        else:
+            monkeypatch.delenv("RSYNC_BINARY", raising=False)
+            monkeypatch.setenv("SCP_BINARY", "/usr/bin/scp")
+        cmd = remote.copy_cmd(["/src/a", "/src/b"], "host:/dst/")
+        assert cmd[-3:] == ["/src/a", "/src/b", "host:/dst/"]
+
+
+class TestSshCmd(object):
+    def test_ssh(self, monkeypatch):
+        """Should reuse the master connection of the remote host."""
+        monkeypatch.setenv("SSH_BINARY", "/usr/bin/ssh")
+        monkeypatch.setattr(remote, "current_user", lambda: "user")
+        cmd = remote.ssh_cmd(
+            {"host": "host", "control_path": CONTROL_PATH}, "ls"
+        )
+        assert cmd == [
+            "/usr/bin/ssh",
+            "-o",
+            "ConnectTimeout=10",
+            "-o",
+            "BatchMode=yes",
+            "-o",
+            "ControlPath={}".format(CONTROL_PATH),
+            "user@host",
+            "ls",
+        ]
+
+    def test_master(self, monkeypatch):
+        """Should start and close the master on the same control path."""
+        monkeypatch.setenv("SSH_BINARY", "/usr/bin/ssh")
+        monkeypatch.setattr(remote, "current_user", lambda: "user")
+        ssh_cfg = {
+            "host": "host",
+            "port": "2222",
+            "control_path": CONTROL_PATH,
+        }
+        control_path = "ControlPath={}".format(CONTROL_PATH)
+
+        master = remote.ssh_master_cmd(ssh_cfg)
+        assert master[1] == "-MNf"
+        assert "ControlPersist=600" in master
+        assert "BatchMode=yes" in master
+        assert control_path in master
+        assert master[-3:] == ["-p", "2222", "user@host"]
+
+        exit_cmd = remote.ssh_exit_cmd(ssh_cfg)
+        assert exit_cmd[1:3] == ["-O", "exit"]
+        assert control_path in exit_cmd
+        assert exit_cmd[-1] == "user@host"
+
+
+class TestControlPath(object):
+    def test_length(self):
+        """Expanded control path must fit in sun_path on all platforms."""
+        # %C expands to a 40 chars hash, ssh appends a 17 chars suffix
+        # while binding the master socket, macOS allows 103 chars
+        expanded = remote.ssh_control_path(999).replace("%C", "0" * 40)
+        assert "%" not in expanded
+        assert len(expanded) + 17 < 104
+
+    def test_unique(self):
+        """Masters with different keys never share a socket."""
+        assert remote.ssh_control_path(0) != remote.ssh_control_path(1)
+
+    def test_no_master(self, monkeypatch):
+        """Without a control path ssh connects directly."""
+        monkeypatch.setenv("SSH_BINARY", "/usr/bin/ssh")
+        cmd = remote.ssh_cmd({"host": "host"}, "ls")
+        assert not any(arg.startswith("ControlPath") for arg in cmd)
+
+
+class TestShellQuote(object):
+    @pytest.mark.parametrize(
+        "arg, expected",
+        (
+            ("/remote/ws", "/remote/ws"),
+            ("/remote/with space", "'/remote/with space'"),
+            ("$HOME/ws", "'$HOME/ws'"),
+            ("~", "~"),
+            ("~/with space", "~/'with space'"),
+            ("~user/ws", "'~user/ws'"),
+        ),
+    )
+    def test_quote(self, arg, expected):
+        """Only a leading ``~`` is left for the remote shell to expand."""
+        assert remote.shell_quote(arg) == expected
+
+    def test_filepath_exists(self):
+        """Path checked on the remote host is quoted."""
+        cmd = remote.remote_filepath_exists(
+            lambda cfg, cmd: cmd, {}, "~/with space"
+        )
+        assert cmd == "test -e ~/'with space'"
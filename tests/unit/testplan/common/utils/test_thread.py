@@ -0,0 +1,66 @@
+import time
+import threading
+
+import pytest
+
+from testplan.common.utils.thread import execute_as_thread, interruptible_join
+from testplan.common.utils.timing import TimeoutException
+
+
+class TestExecuteAsThread(object):
+    def test_join(self):
+        """Target should have completed when the call returns."""
+        result = []
+        execute_as_thread(result.append, args=(1,))
+        assert result == [1]
+
+    def test_no_join(self):
+        """Should return straight away when `join` is False."""
+        release = threading.Event()
+        execute_as_thread(release.wait, join=False, daemon=True)
+        release.set()
+
+    def test_timeout(self):
+        """Should raise if the target outlives the timeout."""
+        release = threading.Event()
+        try:
+            with pytest.raises(TimeoutException):
+                execute_as_thread(release.wait, daemon=True, timeout=0.1)
+        finally:
+            release.set()
+
+    def test_break_join(self):
+        """Should stop joining once the break condition is met."""
+        release = threading.Event()
+        start = time.monotonic()
+        try:
+            execute_as_thread(
+                release.wait,
+                daemon=True,
+                break_join=lambda: time.monotonic() - start > 0.1,
+                timeout=5,
+            )
+        finally:
+            release.set()
+        assert time.monotonic() - start < 5
+
+
+class TestInterruptibleJoin(object):
+    def test_join(self):
+        """Should return as soon as the thread terminates."""
+        thread = threading.Thread(target=time.sleep, args=(0.01,))
+        thread.start()
+        interruptible_join(thread, timeout=5)
+        assert not thread.is_alive()
+
+    def test_timeout(self):
+        """Should raise if the thread is still alive after the timeout."""
+        release = threading.Event()
+        thread = threading.Thread(target=release.wait)
+        thread.start()
+        try:
+            with pytest.raises(TimeoutException):
+                interruptible_join(thread, timeout=0.1)
+        finally:
+            release.set()
+            thread.join()
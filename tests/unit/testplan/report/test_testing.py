@@ -5,6 +5,7 @@ from unittest import mock
 
 import pytest
 from boltons.iterutils import get_path
+from marshmallow.exceptions import ValidationError
 
 from testplan.common.utils.testing import disable_log_propagation
 
@@ -563,3 +564,26 @@ def test_env_status_hash():
     report_group.env_status = entity.ResourceStatus.STARTED
 
     assert report_group.hash != orig_hash
+
+
+def test_timer_serialization():
+    """Timers with open and closed intervals should round trip."""
+    report = TestCaseReport(name="timed")
+    with report.timer.record("run"):
+        pass
+    report.timer.start("teardown")
+
+    data = report.serialize()
+    assert data["timer"]["teardown"]["end"] is None
+
+    deserialized = TestCaseReport.deserialize(data)
+    assert deserialized.timer == report.timer
+
+
+def test_timer_serialization_invalid():
+    """Invalid timer data should still fail schema validation."""
+    data = TestCaseReport(name="timed").serialize()
+    data["timer"] = {"run": {"start": None, "end": None}}
+
+    with pytest.raises(ValidationError):
+        TestCaseReport.deserialize(data)
@@ -0,0 +1,252 @@
+"""Unit test for remote worker setup logic, no remote host is involved."""
+import os
+import time
+import hashlib
+import threading
+
+import pytest
+
+from testplan.runners.pools import remote
+
+
+def _make_worker(**pool_options):
+    pool = remote.RemotePool(
+        name="RemotePool", hosts={"localhost": 1}, **pool_options
+    )
+    pool._add_workers()
+    return list(pool._workers)[0]
+
+
+@pytest.fixture
+def transfers(monkeypatch):
+    """Record data transfers instead of executing them."""
+    calls = []
+    monkeypatch.setattr(
+        remote.RemoteWorker,
+        "_transfer_data",
+        lambda self, **kwargs: calls.append(kwargs),
+    )
+    monkeypatch.setattr(remote, "makedirs", lambda path: None)
+    return calls
+
+
+class TestPullFiles(object):
+    def test_batch(self, transfers):
+        """Entries pulled into the same local dir share one transfer."""
+        worker = _make_worker(pull=["/tmp/a/x", "/tmp/a/y/", "/tmp/b/z"])
+        worker._pull_files()
+        assert [(call["source"], call["target"]) for call in transfers] == [
+            (["/tmp/a/x", "/tmp/a/y"], "/tmp/a"),
+            ("/tmp/b/z", "/tmp/b"),
+        ]
+
+    def test_custom_copy_cmd(self, transfers):
+        """Custom copy commands get one transfer per entry."""
+        worker = _make_worker(
+            pull=["/tmp/a/x", "/tmp/a/y"],
+            copy_cmd=lambda source, target, **kwargs: [],
+        )
+        worker._pull_files()
+        assert [call["source"] for call in transfers] == [
+            "/tmp/a/x",
+            "/tmp/a/y",
+        ]
+
+
+class TestBuildPushLists(object):
+    def test_files_and_dirs(self, tmpdir):
+        """Sources are split into files and dirs, missing ones dropped."""
+        push_file = tmpdir.join("file.txt")
+        push_file.write("")
+        push_dir = tmpdir.mkdir("dir")
+        worker = _make_worker(
+            push=[str(push_file), str(push_dir), str(tmpdir.join("missing"))]
+        )
+        push_files, push_dirs = worker._build_push_lists()
+        assert [path.local for path in push_files] == [str(push_file)]
+        assert [path.local for path in push_dirs] == [str(push_dir)]
+
+    def test_dedup_sub_dirs(self, tmpdir):
+        """Sub-directories of pushed dirs are dropped, siblings are kept."""
+        parent = tmpdir.mkdir("a")
+        child = parent.mkdir("b")
+        sibling = tmpdir.mkdir("a-b")
+        prefixed = tmpdir.mkdir("ab")
+        worker = _make_worker(
+            push=[
+                str(child),
+                "{}/".format(parent),
+                str(sibling),
+                str(prefixed),
+            ]
+        )
+        _, push_dirs = worker._build_push_lists()
+        assert sorted(path.local for path in push_dirs) == sorted(
+            [str(parent), str(sibling), str(prefixed)]
+        )
+
+    def test_dedup_explicit_dests(self, tmpdir):
+        """Sub-directories pushed to a different destination are kept."""
+        parent = tmpdir.mkdir("a")
+        child = parent.mkdir("b")
+        worker = _make_worker(
+            push=[(str(parent), "/remote/a"), (str(child), "/elsewhere/b")]
+        )
+        _, push_dirs = worker._build_push_lists()
+        assert [path.local for path in push_dirs] == [str(parent), str(child)]
+
+
+class TestTransferFileIfChanged(object):
+    @pytest.mark.parametrize("up_to_date", (True, False))
+    def test_checksum(self, monkeypatch, tmpdir, transfers, up_to_date):
+        """File is only copied if the remote target checksum differs."""
+        source = tmpdir.join("dependencies.py")
+        source.write("import os")
+        remote_cmds = []
+
+        def execute_cmd(cmd, **kwargs):
+            remote_cmds.append(cmd[-1])
+            assert kwargs["check"] is False
+            return 0 if up_to_date else 1
+
+        monkeypatch.setattr(remote, "execute_cmd", execute_cmd)
+        worker = _make_worker(ssh_cmd=lambda cfg, cmd: [cmd])
+        worker._transfer_file_if_changed(str(source), "/remote/deps.py")
+
+        digest = hashlib.sha256(b"import os").hexdigest()
+        assert remote_cmds == [
+            'test "$(sha256sum 2>/dev/null < /remote/deps.py)" = '
+            '"{}  -"'.format(digest)
+        ]
+        if up_to_date:
+            assert transfers == []
+        else:
+            assert [call["source"] for call in transfers] == [str(source)]
+
+
+class TestWriteSyspath(object):
+    def test_every_start(self, tmpdir, transfers):
+        """The child removes the sys.path file, each start sends a new one."""
+        worker = _make_worker()
+        worker._remote_testplan_path = "/remote/lib"
+        worker._workspace_paths.local = str(tmpdir)
+
+        first = worker._write_syspath()
+        second = worker._write_syspath()
+        assert [call["target"] for call in transfers] == [first, second]
+        assert first != second
+
+
+class TestRemoteCommands(object):
+    def test_mkdir_quoting(self, monkeypatch):
+        """Remote command arguments are escaped for the remote shell."""
+        remote_cmds = []
+        monkeypatch.setattr(
+            remote,
+            "execute_cmd",
+            lambda cmd, **kwargs: remote_cmds.append(cmd[-1]),
+        )
+        worker = _make_worker(ssh_cmd=lambda cfg, cmd: [cmd])
+        worker._mkdir_remote("/remote/with space")
+        assert remote_cmds == ["/bin/mkdir -p '/remote/with space'"]
+
+    def test_push_mkdir(self, monkeypatch, transfers):
+        """Remote dirs for all pushed entries are created at once."""
+        remote_cmds = []
+        monkeypatch.setattr(
+            remote,
+            "execute_cmd",
+            lambda cmd, **kwargs: remote_cmds.append(cmd[-1]),
+        )
+        worker = _make_worker(ssh_cmd=lambda cfg, cmd: [cmd])
+        worker._push_files_to_dst(
+            [
+                remote._LocationPaths("/a/x", "/remote/a/x"),
+                remote._LocationPaths("/a/y", "/remote/a/y"),
+            ],
+            [remote._LocationPaths("/b/z", "/remote/b/z")],
+        )
+        assert remote_cmds == ["/bin/mkdir -p /remote/a /remote/b"]
+        assert [(call["source"], call["target"]) for call in transfers] == [
+            (["/a/x", "/a/y"], "/remote/a/"),
+            ("/b/z", "/remote/b/z"),
+        ]
+
+
+class TestPrepareRemote(object):
+    def test_max_parallel_setup(self, monkeypatch):
+        """Setup steps running at once are capped by the pool option."""
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def step(self):
+            with lock:
+                running.append(self)
+                peak.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.remove(self)
+
+        for name in (
+            "_open_ssh_master",
+            "_copy_workspace",
+            "_copy_testplan_package",
+            "_copy_dependencies_module",
+            "_push_files",
+            "_set_child_script",
+        ):
+            monkeypatch.setattr(remote.RemoteWorker, name, step)
+        monkeypatch.setattr(
+            remote.RemoteWorker, "_define_remote_dirs", lambda self: None
+        )
+        monkeypatch.setattr(
+            remote.RemoteWorker, "_create_remote_dirs", lambda self: None
+        )
+
+        worker = _make_worker(max_parallel_setup=2)
+        worker._workspace_paths.local = os.getcwd()
+        worker._workspace_paths.remote = "/remote/workspace"
+        worker._prepare_remote()
+        assert len(peak) == 6
+        assert max(peak) == 2
+
+
+class TestSshMaster(object):
+    def test_one_master_per_worker(self, monkeypatch):
+        """Stopping a worker leaves masters of others on the host alive."""
+        monkeypatch.setenv("SSH_BINARY", "/usr/bin/ssh")
+        cmds = []
+
+        def execute_cmd(cmd, **kwargs):
+            cmds.append(cmd)
+            # No master is running yet
+            return 255 if "check" in cmd else 0
+
+        monkeypatch.setattr(remote, "execute_cmd", execute_cmd)
+        first, second = _make_worker(), _make_worker()
+        first._open_ssh_master()
+        second._open_ssh_master()
+        first_path = first.ssh_cfg["control_path"]
+        second_path = second.ssh_cfg["control_path"]
+        assert first_path != second_path
+        assert sum("-MNf" in cmd for cmd in cmds) == 2
+
+        del cmds[:]
+        first._close_ssh_master()
+        assert cmds == [
+            remote.ssh_exit_cmd(dict(first.ssh_cfg, control_path=first_path))
+        ]
+        assert "control_path" not in first.ssh_cfg
+        assert second.ssh_cfg["control_path"] == second_path
+
+    def test_running_master(self, monkeypatch):
+        """No second master is started while the worker's one is alive."""
+        monkeypatch.setenv("SSH_BINARY", "/usr/bin/ssh")
+        cmds = []
+        monkeypatch.setattr(
+            remote, "execute_cmd", lambda cmd, **kwargs: cmds.append(cmd) or 0
+        )
+        _make_worker()._open_ssh_master()
+        assert len(cmds) == 1
+        assert cmds[0][1:3] == ["-O", "check"]
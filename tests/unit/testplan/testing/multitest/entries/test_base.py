@@ -1,6 +1,7 @@
 from testplan.testing.multitest.entries import base
 
 from testplan.testing.multitest.entries import assertions
+from testplan.testing.multitest.entries.schemas import base as schemas
 
 
 def test_double_summary_prevention():
@@ -116,3 +117,46 @@ def test_summary():
 
     assert len(alpha_category_less_passing.entries) == summary.num_passing
     assert len(alpha_category_less_failing.entries) == summary.num_failing
+
+
+def test_schema_lookup():
+    """Schemas resolved by type match the ones bound in the registry."""
+    log = base.Log("message")
+    assertion = assertions.Equal(1, 1)
+    equal_schema = schemas.registry.data[assertions.Equal]
+    for _ in range(2):
+        assert schemas.registry[log] is schemas.LogSchema
+        assert schemas.registry[assertion] is equal_schema
+
+    group = base.Group(entries=[log, assertion], description="group")
+    entries = schemas.registry.serialize(group)["entries"]
+    assert [entry["type"] for entry in entries] == ["Log", "Equal"]
+
+
+def test_schema_lookup_rebind():
+    """Defaults bound after a lookup are used by later lookups."""
+
+    class Entry(object):
+        meta_type = "entry"
+
+    registry = schemas.AssertionSchemaRegistry()
+    registry.bind_default()(schemas.BaseSchema)
+    assert registry[Entry()] is schemas.BaseSchema
+
+    registry.bind_default(category="entry")(schemas.LogSchema)
+    assert registry[Entry()] is schemas.LogSchema
+
+
+def test_schema_reuse():
+    """Schema objects are reused, nested groups get their own."""
+    registry = schemas.registry
+    for _ in range(2):
+        assert registry.serialize(base.Log("message"))["message"] == "message"
+    assert len(registry._free_schemas(schemas.LogSchema)) == 1
+
+    inner = base.Group(entries=[base.Log("inner")], description="inner")
+    outer = base.Group(entries=[inner], description="outer")
+    serialized = registry.serialize(outer)
+    assert serialized["description"] == "outer"
+    assert serialized["entries"][0]["description"] == "inner"
+    assert len(registry._free_schemas(schemas.GroupSchema)) >= 2